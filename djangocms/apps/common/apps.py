@@ -1,3 +1,6 @@
+import atexit
+import logging
+
 from django.apps import AppConfig
 
 
@@ -5,3 +8,12 @@ class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.common"
     verbose_name = "Common Utilities"
+
+    def ready(self):
+        # dictConfig builds the QueueListener behind the "queue" handler
+        # (see settings/prod.py) but leaves starting it to the application.
+        # Requires Python 3.12+ (QueueHandler "handlers" key, getHandlerByName).
+        listener = getattr(logging.getHandlerByName("queue"), "listener", None)
+        if listener is not None:
+            listener.start()
+            atexit.register(listener.stop)
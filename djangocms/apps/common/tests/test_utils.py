@@ -0,0 +1,34 @@
+"""Tests for common utility functions."""
+from django.test import TestCase
+from apps.tenants.models import Tenant
+from apps.common.utils import generate_unique_slug
+
+
+class GenerateUniqueSlugTest(TestCase):
+    """Test generate_unique_slug."""
+
+    def test_unused_slug_returned_as_is(self):
+        """Test a free slug is returned without a suffix."""
+        self.assertEqual(generate_unique_slug(Tenant, "Acme Corp"), "acme-corp")
+
+    def test_first_free_suffix(self):
+        """Test taken slugs get the first free numeric suffix."""
+        Tenant.objects.create(name="Acme", slug="acme")
+        Tenant.objects.create(name="Acme 1", slug="acme-1")
+        Tenant.objects.create(name="Acme 3", slug="acme-3")
+
+        self.assertEqual(generate_unique_slug(Tenant, "Acme"), "acme-2")
+
+    def test_single_query(self):
+        """Test candidates are resolved with a single query."""
+        Tenant.objects.create(name="Acme", slug="acme")
+        Tenant.objects.create(name="Acme 1", slug="acme-1")
+
+        with self.assertNumQueries(1):
+            generate_unique_slug(Tenant, "Acme")
+
+    def test_empty_slug_falls_back_to_model_name(self):
+        """Test names that slugify to nothing use the model name."""
+        Tenant.objects.create(name="Other", slug="tenant")
+
+        self.assertEqual(generate_unique_slug(Tenant, "!!!"), "tenant-1")
@@ -2,6 +2,7 @@
 Common utility functions.
 """
 import re
+from django.db.models import Q
 from django.utils.text import slugify as django_slugify
 
 
@@ -15,13 +16,23 @@ def generate_unique_slug(model_class, base_value: str, slug_field: str = "slug")
         slug_field: The name of the slug field (default: "slug")
 
     Returns:
-        A unique slug string
+        A unique slug string. Falls back to the model name when
+        base_value slugifies to an empty string.
     """
-    base_slug = django_slugify(base_value)
+    base_slug = django_slugify(base_value) or model_class._meta.model_name
+
+    # Fetch every taken candidate in one query instead of probing each suffix
+    taken = set(
+        model_class.objects.filter(
+            Q(**{slug_field: base_slug}) |
+            Q(**{f"{slug_field}__startswith": f"{base_slug}-"})
+        ).values_list(slug_field, flat=True)
+    )
+
     slug = base_slug
     counter = 1
 
-    while model_class.objects.filter(**{slug_field: slug}).exists():
+    while slug in taken:
         slug = f"{base_slug}-{counter}"
         counter += 1
 
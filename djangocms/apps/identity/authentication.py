@@ -3,6 +3,7 @@ JWT authentication with role extraction.
 NO SessionAuthentication for API - JWT only.
 """
 import logging
+import uuid
 from typing import Optional, Tuple
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -97,12 +98,11 @@ class KeycloakJWTAuthentication(KeycloakAuthentication):
         # Sync keycloak_id if not set
         if not user.keycloak_id and ctx.keycloak_id:
             try:
-                import uuid
                 user.keycloak_id = uuid.UUID(ctx.keycloak_id)
                 update_fields.append('keycloak_id')
                 updated = True
             except (ValueError, TypeError):
-                logger.warning(f"Invalid keycloak_id format: {ctx.keycloak_id}")
+                logger.warning("Invalid keycloak_id format: %s", ctx.keycloak_id)
 
         # Sync email
         if ctx.email and user.email != ctx.email:
@@ -124,6 +124,8 @@ class KeycloakJWTAuthentication(KeycloakAuthentication):
 
         if updated:
             user.save(update_fields=update_fields)
-            logger.info(f"Synced user {user.username} with Keycloak (fields: {update_fields})")
+            logger.info(
+                "Synced user %s with Keycloak (fields: %s)", user.username, update_fields
+            )
 
         return user
@@ -43,11 +43,11 @@ class JWKSCache:
         if not force_refresh:
             cached = self.cache.get(cache_key)
             if cached:
-                logger.debug(f"JWKS cache hit for kid: {kid}")
+                logger.debug("JWKS cache hit for kid: %s", kid)
                 return cached
 
         # Fetch fresh JWKS
-        logger.debug(f"Fetching JWKS from {self.jwks_url}")
+        logger.debug("Fetching JWKS from %s", self.jwks_url)
         keys = self._fetch_jwks()
         for key in keys.get("keys", []):
             key_kid = key.get("kid")
@@ -57,7 +57,7 @@ class JWKSCache:
                 if key_kid == kid:
                     return key
 
-        logger.warning(f"Key not found in JWKS for kid: {kid}")
+        logger.warning("Key not found in JWKS for kid: %s", kid)
         return None
 
     def _fetch_jwks(self):
@@ -67,10 +67,10 @@ class JWKSCache:
             response.raise_for_status()
             return response.json()
         except requests.exceptions.Timeout:
-            logger.error(f"Timeout fetching JWKS from {self.jwks_url}")
+            logger.error("Timeout fetching JWKS from %s", self.jwks_url)
             return {"keys": []}
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to fetch JWKS: {e}")
+            logger.error("Failed to fetch JWKS: %s", e)
             return {"keys": []}
 
     def refresh_on_failure(self, kid: str):
@@ -84,7 +84,7 @@ class JWKSCache:
         Returns:
             Key dict or None
         """
-        logger.info(f"Refreshing key for kid: {kid} due to verification failure")
+        logger.info("Refreshing key for kid: %s due to verification failure", kid)
         return self.get_key(kid, force_refresh=True)
 
     def clear_cache(self):
@@ -7,6 +7,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 from drf_spectacular.utils import extend_schema, OpenApiExample
 
+from apps.subscribers import selectors as subscriber_selectors
+from apps.tenants.serializers import TenantMembershipSerializer
 from .serializers import UserSerializer, UserProfileUpdateSerializer
 
 
@@ -103,26 +105,21 @@ JWT bearer token from Keycloak.
 
         # Add tenant memberships
         if hasattr(user, 'tenant_memberships'):
-            from apps.tenants.serializers import TenantMembershipSerializer
             memberships = user.tenant_memberships.select_related('tenant').all()
             data["tenant_memberships"] = TenantMembershipSerializer(
                 memberships, many=True
             ).data
 
-        # Add subscriber profile if exists
-        if hasattr(user, 'subscriber_profile'):
-            try:
-                subscriber = user.subscriber_profile
-                data["subscriber_profile"] = {
-                    "id": subscriber.id,
-                    "radius_username": subscriber.radius_username,
-                    "is_active": subscriber.is_active,
-                    "is_valid": subscriber.is_valid,
-                    "tenant_slug": subscriber.tenant.slug if subscriber.tenant else None,
-                }
-            except Exception:
-                # subscriber_profile might raise DoesNotExist for OneToOne
-                pass
+        # Add subscriber profile if exists (one query, joined with tenant)
+        subscriber = subscriber_selectors.get_subscriber_by_user(user)
+        if subscriber:
+            data["subscriber_profile"] = {
+                "id": subscriber.id,
+                "radius_username": subscriber.radius_username,
+                "is_active": subscriber.is_active,
+                "is_valid": subscriber.is_valid,
+                "tenant_slug": subscriber.tenant.slug,
+            }
 
         return Response(data)
 
@@ -0,0 +1,92 @@
+"""
+Read-only queries for platform administration.
+
+Selectors contain query logic without side effects.
+"""
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, OuterRef, Prefetch, Q, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.subscribers.models import Subscriber
+from apps.tenants.models import Tenant, TenantMembership
+
+User = get_user_model()
+
+
+def get_platform_users() -> QuerySet:
+    """
+    Get all users with the data shown in platform user listings.
+
+    Membership counts are aggregated in SQL and the subscriber profile is
+    joined, so serializing a page of users does not issue per-user queries.
+
+    Returns:
+        QuerySet of User objects annotated with `membership_count`
+    """
+    return User.objects.annotate(
+        membership_count=Count('tenant_memberships')
+    ).select_related('subscriber_profile')
+
+
+def get_platform_tenants() -> QuerySet[Tenant]:
+    """
+    Get all tenants with the data shown in platform tenant listings.
+
+    Member and subscriber counts are aggregated in SQL, and owner
+    memberships (with their users) are prefetched into `owner_memberships`,
+    so serializing a page of tenants costs two queries regardless of size.
+
+    Returns:
+        QuerySet of Tenant objects annotated with `membership_count` and
+        `subscriber_count`
+    """
+    # Correlated subqueries keep each count on its own tenant index instead of
+    # joining memberships x subscribers into one grouped row set
+    membership_count = TenantMembership.objects.filter(
+        tenant=OuterRef('pk')
+    ).values('tenant').annotate(c=Count('pk')).values('c')
+    subscriber_count = Subscriber.objects.filter(
+        tenant=OuterRef('pk')
+    ).values('tenant').annotate(c=Count('pk')).values('c')
+
+    return Tenant.objects.annotate(
+        membership_count=Coalesce(Subquery(membership_count), 0),
+        subscriber_count=Coalesce(Subquery(subscriber_count), 0),
+    ).prefetch_related(
+        Prefetch(
+            'memberships',
+            queryset=TenantMembership.objects.filter(
+                role=TenantMembership.Role.OWNER
+            ).select_related('user').order_by('pk'),
+            to_attr='owner_memberships',
+        )
+    )
+
+
+def get_platform_stats() -> dict:
+    """
+    Compute platform-wide statistics for the admin dashboard.
+
+    Returns:
+        Dict of counts matching PlatformStatsSerializer
+    """
+    month_ago = timezone.now() - timedelta(days=30)
+
+    # One aggregate per table, using filtered counts for the sub-totals
+    user_stats = User.objects.aggregate(
+        total_users=Count('pk'),
+        users_created_this_month=Count('pk', filter=Q(date_joined__gte=month_ago)),
+    )
+    tenant_stats = Tenant.objects.aggregate(
+        total_tenants=Count('pk', filter=Q(is_active=True)),
+        tenants_created_this_month=Count('pk', filter=Q(created_at__gte=month_ago)),
+    )
+    subscriber_stats = Subscriber.objects.aggregate(
+        total_subscribers=Count('pk'),
+        active_subscribers=Count('pk', filter=Q(is_active=True)),
+    )
+
+    return {**user_stats, **tenant_stats, **subscriber_stats}
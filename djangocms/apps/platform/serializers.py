@@ -34,6 +34,9 @@ class PlatformUserSerializer(serializers.ModelSerializer):
         ]
 
     def get_tenant_count(self, obj):
+        # Annotated by selectors.get_platform_users()
+        if hasattr(obj, 'membership_count'):
+            return obj.membership_count
         return obj.tenant_memberships.count()
 
     def get_has_subscriber_profile(self, obj):
@@ -65,13 +68,22 @@ class PlatformTenantSerializer(serializers.ModelSerializer):
         ]
 
     def get_member_count(self, obj):
+        # Annotated by selectors.get_platform_tenants()
+        if hasattr(obj, 'membership_count'):
+            return obj.membership_count
         return obj.memberships.count()
 
     def get_subscriber_count(self, obj):
+        if hasattr(obj, 'subscriber_count'):
+            return obj.subscriber_count
         return obj.subscribers.count()
 
     def get_owner_email(self, obj):
-        owner = obj.memberships.filter(role=TenantMembership.Role.OWNER).first()
+        # Prefetched by selectors.get_platform_tenants()
+        if hasattr(obj, 'owner_memberships'):
+            owner = obj.owner_memberships[0] if obj.owner_memberships else None
+        else:
+            owner = obj.memberships.filter(role=TenantMembership.Role.OWNER).first()
         return owner.user.email if owner else None
 
 
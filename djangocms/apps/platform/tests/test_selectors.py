@@ -0,0 +1,114 @@
+"""Tests for platform selectors (read-only queries)."""
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from apps.tenants.models import Tenant, TenantMembership
+from apps.subscribers.models import Subscriber
+from apps.platform import selectors
+from apps.platform.serializers import PlatformTenantSerializer, PlatformUserSerializer
+
+User = get_user_model()
+
+
+class PlatformSelectorsTest(TestCase):
+    """Test platform selector functions."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user1 = User.objects.create_user(
+            username="user1",
+            email="user1@example.com"
+        )
+        self.user2 = User.objects.create_user(
+            username="user2",
+            email="user2@example.com"
+        )
+
+        self.tenant1 = Tenant.objects.create(name="Tenant 1", slug="tenant-1")
+        self.tenant2 = Tenant.objects.create(name="Tenant 2", slug="tenant-2")
+
+        TenantMembership.objects.create(user=self.user1, tenant=self.tenant1)
+        TenantMembership.objects.create(user=self.user1, tenant=self.tenant2)
+
+        Subscriber.objects.create(
+            user=self.user1,
+            tenant=self.tenant1,
+            radius_username="sub_user1"
+        )
+
+    def test_get_platform_users_membership_count(self):
+        """Test get_platform_users annotates membership counts."""
+        users = {u.username: u for u in selectors.get_platform_users()}
+
+        self.assertEqual(users["user1"].membership_count, 2)
+        self.assertEqual(users["user2"].membership_count, 0)
+
+    def test_get_platform_users_serializes_without_extra_queries(self):
+        """Test serializing platform users costs a single query."""
+        with self.assertNumQueries(1):
+            data = PlatformUserSerializer(
+                selectors.get_platform_users().order_by("username"),
+                many=True
+            ).data
+
+        self.assertEqual(data[0]["tenant_count"], 2)
+        self.assertTrue(data[0]["has_subscriber_profile"])
+        self.assertEqual(data[1]["tenant_count"], 0)
+        self.assertFalse(data[1]["has_subscriber_profile"])
+
+    def test_get_platform_tenants_prefetches_owner(self):
+        """Test get_platform_tenants resolves owner emails from the prefetch."""
+        TenantMembership.objects.create(
+            user=self.user2,
+            tenant=self.tenant2,
+            role=TenantMembership.Role.OWNER
+        )
+
+        tenants = list(selectors.get_platform_tenants().order_by("slug"))
+
+        with self.assertNumQueries(0):
+            owner_emails = [
+                PlatformTenantSerializer().get_owner_email(t) for t in tenants
+            ]
+
+        self.assertEqual(owner_emails, [None, "user2@example.com"])
+
+    def test_get_platform_tenants_counts(self):
+        """Test get_platform_tenants annotates member and subscriber counts."""
+        TenantMembership.objects.create(user=self.user2, tenant=self.tenant1)
+        Subscriber.objects.create(
+            user=self.user2,
+            tenant=self.tenant1,
+            radius_username="sub_user2"
+        )
+
+        with self.assertNumQueries(2):
+            data = PlatformTenantSerializer(
+                selectors.get_platform_tenants().order_by("slug"),
+                many=True
+            ).data
+
+        # Two members and two subscribers must not multiply each other
+        self.assertEqual(data[0]["member_count"], 2)
+        self.assertEqual(data[0]["subscriber_count"], 2)
+        self.assertEqual(data[1]["member_count"], 1)
+        self.assertEqual(data[1]["subscriber_count"], 0)
+
+    def test_get_platform_stats(self):
+        """Test get_platform_stats counts with one query per table."""
+        Subscriber.objects.create(
+            user=self.user2,
+            tenant=self.tenant2,
+            radius_username="sub_user2",
+            is_active=False
+        )
+        Tenant.objects.filter(pk=self.tenant2.pk).update(is_active=False)
+
+        with self.assertNumQueries(3):
+            stats = selectors.get_platform_stats()
+
+        self.assertEqual(stats["total_users"], 2)
+        self.assertEqual(stats["users_created_this_month"], 2)
+        self.assertEqual(stats["total_tenants"], 1)
+        self.assertEqual(stats["tenants_created_this_month"], 2)
+        self.assertEqual(stats["total_subscribers"], 2)
+        self.assertEqual(stats["active_subscribers"], 1)
@@ -1,18 +1,18 @@
 """
 Platform admin views - cross-tenant administration.
 """
-from datetime import timedelta
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
-from django.utils import timezone
-from django.db.models import Count, Q
+from django.core.cache import cache
+from django.db.models import Q
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 
+from apps.common.pagination import StandardPagination
 from apps.tenants.models import Tenant
-from apps.subscribers.models import Subscriber
 from .permissions import IsPlatformAdmin
+from . import selectors
 from .serializers import (
     PlatformUserSerializer,
     PlatformTenantSerializer,
@@ -21,6 +21,9 @@ from .serializers import (
 
 User = get_user_model()
 
+PLATFORM_STATS_CACHE_KEY = "platform:stats"
+PLATFORM_STATS_CACHE_TTL = 60  # seconds
+
 
 class PlatformStatsView(APIView):
     """
@@ -43,26 +46,18 @@ Retrieve platform-wide statistics and metrics.
 - Total subscribers (all and active)
 - New tenants this month
 - New users this month
+
+Statistics are cached for up to 60 seconds.
 """,
         responses={200: PlatformStatsSerializer},
     )
     def get(self, request):
         """Get platform-wide statistics."""
-        now = timezone.now()
-        month_ago = now - timedelta(days=30)
-
-        stats = {
-            "total_users": User.objects.count(),
-            "total_tenants": Tenant.objects.filter(is_active=True).count(),
-            "total_subscribers": Subscriber.objects.count(),
-            "active_subscribers": Subscriber.objects.filter(is_active=True).count(),
-            "tenants_created_this_month": Tenant.objects.filter(
-                created_at__gte=month_ago
-            ).count(),
-            "users_created_this_month": User.objects.filter(
-                date_joined__gte=month_ago
-            ).count(),
-        }
+        stats = cache.get_or_set(
+            PLATFORM_STATS_CACHE_KEY,
+            selectors.get_platform_stats,
+            PLATFORM_STATS_CACHE_TTL,
+        )
 
         serializer = PlatformStatsSerializer(stats)
         return Response(serializer.data)
@@ -88,7 +83,7 @@ List all users in the system with filtering and pagination.
 - `has_keycloak` - Filter by Keycloak ID presence (true/false)
 - `search` - Search by email, username, first/last name
 - `page` - Page number (default: 1)
-- `page_size` - Items per page (default: 20)
+- `page_size` - Items per page (default: 20, max: 100)
 """,
         parameters=[
             OpenApiParameter(name="is_active", type=bool, location=OpenApiParameter.QUERY),
@@ -112,7 +107,7 @@ List all users in the system with filtering and pagination.
     )
     def get(self, request):
         """List all users with optional filtering."""
-        users = User.objects.all().order_by('-date_joined')
+        users = selectors.get_platform_users().order_by('-date_joined')
 
         # Optional filters
         is_active = request.query_params.get('is_active')
@@ -136,8 +131,11 @@ List all users in the system with filtering and pagination.
             )
 
         # Pagination
-        page_size = int(request.query_params.get('page_size', 20))
-        page = int(request.query_params.get('page', 1))
+        page_size = min(
+            max(int(request.query_params.get('page_size', 20)), 1),
+            StandardPagination.max_page_size
+        )
+        page = max(int(request.query_params.get('page', 1)), 1)
         offset = (page - 1) * page_size
 
         total = users.count()
@@ -170,7 +168,7 @@ class PlatformUserDetailView(APIView):
     def get(self, request, user_id):
         """Get detailed user information."""
         try:
-            user = User.objects.get(id=user_id)
+            user = selectors.get_platform_users().get(id=user_id)
         except User.DoesNotExist:
             return Response(
                 {"detail": "User not found."},
@@ -200,7 +198,7 @@ List all tenants in the system with filtering and pagination.
 - `is_active` - Filter by active status (true/false)
 - `search` - Search by name, slug, or email
 - `page` - Page number (default: 1)
-- `page_size` - Items per page (default: 20)
+- `page_size` - Items per page (default: 20, max: 100)
 """,
         parameters=[
             OpenApiParameter(name="is_active", type=bool, location=OpenApiParameter.QUERY),
@@ -223,7 +221,7 @@ List all tenants in the system with filtering and pagination.
     )
     def get(self, request):
         """List all tenants with optional filtering."""
-        tenants = Tenant.objects.all().order_by('-created_at')
+        tenants = selectors.get_platform_tenants().order_by('-created_at')
 
         # Optional filters
         is_active = request.query_params.get('is_active')
@@ -239,8 +237,11 @@ List all tenants in the system with filtering and pagination.
             )
 
         # Pagination
-        page_size = int(request.query_params.get('page_size', 20))
-        page = int(request.query_params.get('page', 1))
+        page_size = min(
+            max(int(request.query_params.get('page_size', 20)), 1),
+            StandardPagination.max_page_size
+        )
+        page = max(int(request.query_params.get('page', 1)), 1)
         offset = (page - 1) * page_size
 
         total = tenants.count()
@@ -273,7 +274,7 @@ class PlatformTenantDetailView(APIView):
     def get(self, request, slug):
         """Get detailed tenant information."""
         try:
-            tenant = Tenant.objects.get(slug=slug)
+            tenant = selectors.get_platform_tenants().get(slug=slug)
         except Tenant.DoesNotExist:
             return Response(
                 {"detail": "Tenant not found."},
@@ -306,7 +307,7 @@ Platform admins can update any tenant field without ownership restrictions.
     def patch(self, request, slug):
         """Update tenant (platform admin can update any field)."""
         try:
-            tenant = Tenant.objects.get(slug=slug)
+            tenant = selectors.get_platform_tenants().get(slug=slug)
         except Tenant.DoesNotExist:
             return Response(
                 {"detail": "Tenant not found."},
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.3 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscribers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='subscriber',
+            index=models.Index(fields=['tenant', '-created_at'], name='subscribers_tenant__6eb92e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscriber',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['tenant', 'expires_at'], name='subscriber_active_expires_idx'),
+        ),
+    ]
@@ -64,6 +64,12 @@ class Subscriber(models.Model):
         indexes = [
             models.Index(fields=["tenant", "is_active"]),
             models.Index(fields=["expires_at"]),
+            models.Index(fields=["tenant", "-created_at"]),
+            models.Index(
+                fields=["tenant", "expires_at"],
+                condition=models.Q(is_active=True),
+                name="subscriber_active_expires_idx",
+            ),
         ]
 
     def __str__(self):
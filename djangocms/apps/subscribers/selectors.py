@@ -12,7 +12,7 @@ from .models import Subscriber
 
 def get_subscriber_by_user(user) -> Optional[Subscriber]:
     """
-    Get subscriber profile for a user.
+    Get subscriber profile for a user, joined with its tenant.
 
     Args:
         user: User instance
@@ -20,10 +20,7 @@ def get_subscriber_by_user(user) -> Optional[Subscriber]:
     Returns:
         Subscriber or None
     """
-    try:
-        return user.subscriber_profile
-    except Subscriber.DoesNotExist:
-        return None
+    return Subscriber.objects.filter(user=user).select_related('tenant').first()
 
 
 def get_subscriber_by_radius_username(radius_username: str) -> Optional[Subscriber]:
@@ -96,7 +96,9 @@ def create_subscriber(
         expires_at=expires_at,
     )
 
-    logger.info(f"Created subscriber {radius_username} for {user.email} in {tenant.slug}")
+    logger.info(
+        "Created subscriber %s for %s in %s", radius_username, user.email, tenant.slug
+    )
     return subscriber
 
 
@@ -134,7 +136,7 @@ def update_subscriber(
 
     if update_fields:
         subscriber.save(update_fields=update_fields)
-        logger.info(f"Updated subscriber {subscriber.radius_username}: {update_fields}")
+        logger.info("Updated subscriber %s: %s", subscriber.radius_username, update_fields)
 
     return subscriber
 
@@ -184,8 +186,9 @@ def extend_subscription(
         Updated Subscriber instance
     """
     # If currently expired or no expiry, start from now
-    if subscriber.expires_at is None or subscriber.expires_at < timezone.now():
-        new_expires_at = timezone.now() + timedelta(days=days)
+    now = timezone.now()
+    if subscriber.expires_at is None or subscriber.expires_at < now:
+        new_expires_at = now + timedelta(days=days)
     else:
         new_expires_at = subscriber.expires_at + timedelta(days=days)
 
@@ -239,7 +242,7 @@ def delete_subscriber(subscriber: Subscriber, requesting_user) -> None:
 
     radius_username = subscriber.radius_username
     subscriber.delete()
-    logger.info(f"Deleted subscriber {radius_username} by {requesting_user.email}")
+    logger.info("Deleted subscriber %s by %s", radius_username, requesting_user.email)
 
 
 def bulk_deactivate_expired(tenant: Tenant) -> int:
@@ -260,6 +263,6 @@ def bulk_deactivate_expired(tenant: Tenant) -> int:
     ).update(is_active=False)
 
     if count > 0:
-        logger.info(f"Deactivated {count} expired subscribers in {tenant.slug}")
+        logger.info("Deactivated %d expired subscribers in %s", count, tenant.slug)
 
     return count
@@ -0,0 +1,47 @@
+"""Tests for subscriber views."""
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIRequestFactory, force_authenticate
+from apps.tenants.models import Tenant
+from apps.subscribers.models import Subscriber
+from apps.subscribers.views import TenantSubscriberListView
+
+User = get_user_model()
+
+
+class TenantSubscriberListViewTest(TestCase):
+    """Test tenant subscriber list endpoint."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.factory = APIRequestFactory()
+        self.admin = User.objects.create_superuser(
+            username="admin",
+            email="admin@example.com",
+            password="unused"
+        )
+        self.tenant = Tenant.objects.create(name="Test Tenant", slug="test")
+
+        users = User.objects.bulk_create([
+            User(username=f"sub{i}", email=f"sub{i}@example.com")
+            for i in range(105)
+        ])
+        Subscriber.objects.bulk_create([
+            Subscriber(user=user, tenant=self.tenant, radius_username=f"radius_{i}")
+            for i, user in enumerate(users)
+        ])
+
+    def test_page_size_capped_at_max(self):
+        """Test page_size above 100 is capped and the response is paginated."""
+        request = self.factory.get(
+            "/api/tenants/test/subscribers/", {"page_size": 500}
+        )
+        force_authenticate(request, user=self.admin)
+
+        response = TenantSubscriberListView.as_view()(request, slug="test")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 105)
+        self.assertEqual(len(response.data["results"]), 100)
+        self.assertIsNotNone(response.data["next"])
+        self.assertIsNone(response.data["previous"])
@@ -10,6 +10,7 @@ from django.contrib.auth import get_user_model
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 
 from apps.common.exceptions import TenantNotFoundException, SubscriberNotFoundException
+from apps.common.pagination import StandardPagination
 from apps.tenants.models import Tenant
 from apps.tenants import selectors as tenant_selectors
 from .models import Subscriber
@@ -96,6 +97,8 @@ List all subscribers within a tenant.
 
 ### Query Parameters
 - `active_only` - Filter to only active subscribers (default: false)
+- `page` - Page number (default: 1)
+- `page_size` - Items per page (default: 20, max: 100)
 """,
         parameters=[
             OpenApiParameter(name="slug", type=str, location=OpenApiParameter.PATH),
@@ -106,8 +109,21 @@ List all subscribers within a tenant.
                 description="Filter to only active subscribers",
                 required=False,
             ),
+            OpenApiParameter(name="page", type=int, location=OpenApiParameter.QUERY),
+            OpenApiParameter(name="page_size", type=int, location=OpenApiParameter.QUERY),
         ],
-        responses={200: SubscriberDetailSerializer(many=True)},
+        responses={
+            200: OpenApiExample(
+                "Paginated Response",
+                value={
+                    "count": 42,
+                    "next": "https://api.example.com/api/tenants/acme/subscribers/?page=2",
+                    "previous": None,
+                    "results": [{"id": 1, "radius_username": "acme_a1b2c3"}]
+                },
+                response_only=True,
+            )
+        },
     )
     def get(self, request, slug):
         """List all subscribers of the tenant (admin only)."""
@@ -125,8 +141,11 @@ List all subscribers within a tenant.
         active_only = request.query_params.get('active_only', 'false').lower() == 'true'
 
         subscribers = selectors.get_tenant_subscribers(tenant, active_only=active_only)
-        serializer = SubscriberDetailSerializer(subscribers, many=True)
-        return Response(serializer.data)
+
+        paginator = StandardPagination()
+        page = paginator.paginate_queryset(subscribers, request, view=self)
+        serializer = SubscriberDetailSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
     @extend_schema(
         tags=["Subscribers"],
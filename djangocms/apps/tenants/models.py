@@ -53,6 +53,9 @@ class TenantMembership(models.Model):
         ADMIN = "admin", "Admin"
         MEMBER = "member", "Member"
 
+    # Roles with tenant admin rights, shared by is_admin and role__in lookups
+    ADMIN_ROLES = (Role.OWNER, Role.ADMIN)
+
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -87,4 +90,4 @@ class TenantMembership(models.Model):
     @property
     def is_admin(self) -> bool:
         """Check if this membership has admin or owner role."""
-        return self.role in [self.Role.OWNER, self.Role.ADMIN]
+        return self.role in self.ADMIN_ROLES
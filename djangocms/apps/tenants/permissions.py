@@ -83,7 +83,7 @@ class IsTenantAdmin(BasePermission):
         return TenantMembership.objects.filter(
             user=request.user,
             tenant_id=tenant_id,
-            role__in=[TenantMembership.Role.OWNER, TenantMembership.Role.ADMIN]
+            role__in=TenantMembership.ADMIN_ROLES
         ).exists()
 
 
@@ -134,10 +134,7 @@ def get_tenant_admins(tenant: Tenant) -> QuerySet[User]:
     """
     return User.objects.filter(
         tenant_memberships__tenant=tenant,
-        tenant_memberships__role__in=[
-            TenantMembership.Role.OWNER,
-            TenantMembership.Role.ADMIN
-        ]
+        tenant_memberships__role__in=TenantMembership.ADMIN_ROLES
     )
 
 
@@ -172,7 +169,7 @@ def user_is_tenant_admin(user, tenant: Tenant) -> bool:
     return TenantMembership.objects.filter(
         user=user,
         tenant=tenant,
-        role__in=[TenantMembership.Role.OWNER, TenantMembership.Role.ADMIN]
+        role__in=TenantMembership.ADMIN_ROLES
     ).exists()
 
 
@@ -62,7 +62,7 @@ def create_tenant(
         role=TenantMembership.Role.OWNER
     )
 
-    logger.info(f"Created tenant '{tenant.name}' with owner {owner_user.email}")
+    logger.info("Created tenant '%s' with owner %s", tenant.name, owner_user.email)
     return tenant
 
 
@@ -99,7 +99,7 @@ def update_tenant(
             setattr(tenant, field, kwargs[field])
 
     tenant.save()
-    logger.info(f"Updated tenant '{tenant.name}' by {requesting_user.email}")
+    logger.info("Updated tenant '%s' by %s", tenant.name, requesting_user.email)
     return tenant
 
 
@@ -137,9 +137,9 @@ def add_member(
     )
 
     if created:
-        logger.info(f"Added {user.email} to tenant '{tenant.name}' as {role}")
+        logger.info("Added %s to tenant '%s' as %s", user.email, tenant.name, role)
     else:
-        logger.info(f"User {user.email} already member of tenant '{tenant.name}'")
+        logger.info("User %s already member of tenant '%s'", user.email, tenant.name)
 
     return membership, created
 
@@ -180,8 +180,8 @@ def update_member_role(
     membership.save(update_fields=['role'])
 
     logger.info(
-        f"Changed {membership.user.email} role in '{tenant.name}' "
-        f"from {old_role} to {new_role}"
+        "Changed %s role in '%s' from %s to %s",
+        membership.user.email, tenant.name, old_role, new_role
     )
     return membership
 
@@ -224,7 +224,7 @@ def remove_member(
 
     user_email = membership.user.email
     membership.delete()
-    logger.info(f"Removed {user_email} from tenant '{tenant.name}'")
+    logger.info("Removed %s from tenant '%s'", user_email, tenant.name)
 
 
 def leave_tenant(
@@ -248,17 +248,17 @@ def leave_tenant(
 
     # Check if sole owner
     if membership.role == TenantMembership.Role.OWNER:
-        owner_count = TenantMembership.objects.filter(
+        has_other_owner = TenantMembership.objects.filter(
             tenant=tenant,
             role=TenantMembership.Role.OWNER
-        ).count()
-        if owner_count == 1:
+        ).exclude(pk=membership.pk).exists()
+        if not has_other_owner:
             raise PermissionDeniedException(
                 "Cannot leave as sole owner. Transfer ownership first."
             )
 
     membership.delete()
-    logger.info(f"User {user.email} left tenant '{tenant.name}'")
+    logger.info("User %s left tenant '%s'", user.email, tenant.name)
 
 
 @transaction.atomic
@@ -300,8 +300,8 @@ def transfer_ownership(
     to_membership.save(update_fields=['role'])
 
     logger.info(
-        f"Transferred ownership of '{tenant.name}' "
-        f"from {from_user.email} to {to_user.email}"
+        "Transferred ownership of '%s' from %s to %s",
+        tenant.name, from_user.email, to_user.email
     )
 
     return from_membership, to_membership
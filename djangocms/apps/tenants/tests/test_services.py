@@ -3,6 +3,7 @@ from django.test import TestCase
 from django.contrib.auth import get_user_model
 from apps.tenants.models import Tenant, TenantMembership
 from apps.tenants import services
+from apps.common.exceptions import PermissionDeniedException
 
 User = get_user_model()
 
@@ -137,3 +138,41 @@ class TenantServicesTest(TestCase):
         tenant = Tenant.objects.create(name="Test Tenant", slug="test")
 
         self.assertFalse(services.can_user_manage_tenant(self.user, tenant))
+
+    def test_leave_tenant_sole_owner_denied(self):
+        """Test leave_tenant refuses to remove the only owner."""
+        tenant = services.create_tenant(
+            name="Test Tenant",
+            slug="test",
+            owner_user=self.user
+        )
+
+        with self.assertRaises(PermissionDeniedException):
+            services.leave_tenant(tenant, self.user)
+
+        self.assertTrue(
+            TenantMembership.objects.filter(user=self.user, tenant=tenant).exists()
+        )
+
+    def test_leave_tenant_owner_with_co_owner(self):
+        """Test leave_tenant allows an owner to leave when another owner remains."""
+        tenant = services.create_tenant(
+            name="Test Tenant",
+            slug="test",
+            owner_user=self.user
+        )
+        co_owner = User.objects.create_user(
+            username="coowner",
+            email="coowner@example.com"
+        )
+        TenantMembership.objects.create(
+            user=co_owner,
+            tenant=tenant,
+            role=TenantMembership.Role.OWNER
+        )
+
+        services.leave_tenant(tenant, self.user)
+
+        self.assertFalse(
+            TenantMembership.objects.filter(user=self.user, tenant=tenant).exists()
+        )
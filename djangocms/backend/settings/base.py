@@ -120,6 +120,8 @@ MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    # Compress API/HTML responses; static files are pre-compressed by WhiteNoise
+    "django.middleware.gzip.GZipMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -185,6 +187,14 @@ DATABASES = {
         "PASSWORD": os.environ.get("SQL_PASSWORD", "password"),
         "HOST": os.environ.get("SQL_HOST", "localhost"),
         "PORT": os.environ.get("SQL_PORT", 5432),
+        # Keep connections open between requests instead of reconnecting
+        # (and forking a Postgres backend) on every request.
+        "CONN_MAX_AGE": int(os.environ.get("SQL_CONN_MAX_AGE", 60)),
+        # Ping a reused connection before a request uses it, so a connection
+        # dropped by Postgres or pgBouncer is replaced instead of erroring.
+        "CONN_HEALTH_CHECKS": True,
+        # Required when SQL_HOST points at pgBouncer in transaction mode.
+        "DISABLE_SERVER_SIDE_CURSORS": os.environ.get("SQL_DISABLE_SERVER_SIDE_CURSORS") == "True",
     }
 }
 
@@ -50,24 +50,33 @@ LOGGING = {
             "class": "logging.StreamHandler",
             "formatter": "verbose",
         },
+        # Requests only enqueue records; a background listener thread
+        # formats them and writes to the console handler. The "handlers"
+        # key needs Python 3.12+ (see Dockerfile); the listener is started
+        # in apps.common.apps.CommonConfig.ready().
+        "queue": {
+            "class": "logging.handlers.QueueHandler",
+            "handlers": ["console"],
+            "respect_handler_level": True,
+        },
     },
     "root": {
-        "handlers": ["console"],
+        "handlers": ["queue"],
         "level": "WARNING",
     },
     "loggers": {
         "django": {
-            "handlers": ["console"],
+            "handlers": ["queue"],
             "level": "WARNING",
             "propagate": False,
         },
         "django.security": {
-            "handlers": ["console"],
+            "handlers": ["queue"],
             "level": "WARNING",
             "propagate": False,
         },
         "apps": {
-            "handlers": ["console"],
+            "handlers": ["queue"],
             "level": "INFO",
             "propagate": False,
         },
@@ -49,6 +49,10 @@ echo ""
 
 failed_tests=()
 
+# Common app tests
+echo -e "${YELLOW}=== COMMON APP TESTS ===${NC}"
+run_tests "apps.common.tests.test_utils" "Common Utils" || failed_tests+=("Common Utils")
+
 # Identity app tests
 echo -e "${YELLOW}=== IDENTITY APP TESTS ===${NC}"
 run_tests "apps.identity.tests.test_models" "Identity Models" || failed_tests+=("Identity Models")
@@ -65,10 +69,12 @@ run_tests "apps.tenants.tests.test_permissions" "Tenant Permissions" || failed_t
 echo -e "${YELLOW}=== SUBSCRIBERS APP TESTS ===${NC}"
 run_tests "apps.subscribers.tests.test_models" "Subscriber Models" || failed_tests+=("Subscriber Models")
 run_tests "apps.subscribers.tests.test_permissions" "Subscriber Permissions" || failed_tests+=("Subscriber Permissions")
+run_tests "apps.subscribers.tests.test_views" "Subscriber Views" || failed_tests+=("Subscriber Views")
 
 # Platform app tests
 echo -e "${YELLOW}=== PLATFORM APP TESTS ===${NC}"
 run_tests "apps.platform.tests.test_permissions" "Platform Permissions" || failed_tests+=("Platform Permissions")
+run_tests "apps.platform.tests.test_selectors" "Platform Selectors" || failed_tests+=("Platform Selectors")
 
 # Summary
 echo -e "${YELLOW}========================================${NC}"